@@ -0,0 +1,47 @@
+import logging
+from collections.abc import Callable
+
+from app.models.payment import CoalescedPaymentRequest, PaymentResult
+from app.services.payment_requests import fan_out_result
+from app.services.venmo import IVenmoService
+
+logger = logging.getLogger(__name__)
+
+
+async def dispatch_batches(
+    venmo_service: IVenmoService,
+    batches: list[CoalescedPaymentRequest],
+    on_error: Callable[[Exception, str], None] | None = None,
+) -> list[PaymentResult]:
+    """Send one Venmo request per batch and collect a result for every source row.
+
+    Args:
+        venmo_service: Service used to send the Venmo requests
+        batches: Requests to send, each with the sheet rows it covers
+        on_error: Optional callback invoked with the error and its context when a request fails
+
+    Returns:
+        list[PaymentResult]: One result per source row, in batch order
+    """
+    results: list[PaymentResult] = []
+    for batch in batches:
+        request = batch.request
+        try:
+            # Request payment from each user
+            success = await venmo_service.request_payment(
+                user_id=request.venmo_id,
+                amount=request.amount,
+                note=request.note,
+            )
+            if success:
+                logger.info(f"Successfully requested payment from {request.venmo_id}")
+            else:
+                logger.warning(f"Failed to request payment from {request.venmo_id}")
+            results.extend(fan_out_result(batch, success))
+        except Exception as e:
+            logger.error(f"Error processing request for {request.venmo_id}: {e!s}")
+            results.extend(fan_out_result(batch, False, str(e)))
+            if on_error is not None:
+                on_error(e, f"processing request for {request.venmo_id}")
+
+    return results
@@ -5,11 +5,21 @@ from pathlib import Path
 
 from dotenv import load_dotenv
 
-from app.models.config import AppConfig, EmailConfig, GoogleSheetsConfig, VenmoConfig
+from app.dispatch import dispatch_batches
+from app.models.config import (
+    DEFAULT_RUN_LOCK_DIR,
+    AppConfig,
+    EmailConfig,
+    GoogleSheetsConfig,
+    VenmoConfig,
+)
+from app.models.payment import CoalescedPaymentRequest
+from app.run_lock import run_lock
 from app.services.container import ServiceContainer
 from app.services.email import IEmailService
-from app.services.payment_requests import IPaymentRequestRepository
+from app.services.payment_requests import IPaymentRequestRepository, coalesce_payment_requests
 from app.services.venmo import IVenmoService
+from app.sharding import run_sharded
 
 # Load environment variables from .env file
 load_dotenv()
@@ -42,6 +52,9 @@ def create_config() -> AppConfig:
             spreadsheet_id=os.getenv("GOOGLE_SHEETS_SPREADSHEET_ID"),
         ),
         log_level=os.getenv("LOG_LEVEL", "INFO"),
+        coalesce_requests=os.getenv("COALESCE_REQUESTS", "false").lower() == "true",
+        shard_count=int(os.getenv("SHARD_COUNT", "1")),
+        run_lock_dir=Path(os.getenv("RUN_LOCK_DIR", DEFAULT_RUN_LOCK_DIR)),
     )
 
 
@@ -52,7 +65,7 @@ async def main():
     1. Sets up logging
     2. Loads configuration
     3. Initializes services
-    4. Processes pending payment requests
+    4. Processes pending payment requests, unless another run holds the run lock
     5. Handles errors and sends notifications
     """
     # Configure logging
@@ -72,34 +85,51 @@ async def main():
         payment_request_repository: IPaymentRequestRepository = container.payment_request_repository
         venmo_service: IVenmoService = container.venmo_service
 
-        # Process pending requests
-        pending_requests = await payment_request_repository.get_payment_requests()
-        logger.info(f"Found {len(pending_requests)} pending requests")
-
-        successful_requests = []
-        for request in pending_requests:
-            try:
-                # Request payment from each user
-                success = await venmo_service.request_payment(
-                    user_id=request.user_id,
-                    amount=request.amount,
-                    note=request.note,
-                )
-                if success:
-                    logger.info(f"Successfully requested payment from {request.user_id}")
-                    successful_requests.append(request)
-                else:
-                    logger.warning(f"Failed to request payment from {request.user_id}")
-            except Exception as e:
-                logger.error(f"Error processing request for {request.user_id}: {e!s}")
-                email_service.send_error_notification(
-                    e,
-                    f"processing request for {request.user_id}",
+        # Hold the run lock from reading the sheet until every request has been sent
+        with run_lock(config.run_lock_dir) as acquired:
+            if not acquired:
+                logger.warning("Another run is already in progress, skipping this run")
+                return
+
+            # Process pending requests
+            pending_requests = await payment_request_repository.get_payment_requests()
+            logger.info(f"Found {len(pending_requests)} pending requests")
+
+            # Optionally merge rows for the same user into a single Venmo request
+            if config.coalesce_requests:
+                batches = coalesce_payment_requests(pending_requests)
+                logger.info(f"Coalesced into {len(batches)} Venmo requests")
+            else:
+                batches = [
+                    CoalescedPaymentRequest(request=request, sources=[request])
+                    for request in pending_requests
+                ]
+
+            if config.shard_count > 1:
+                # Split requests across worker processes
+                results = await run_sharded(config, batches)
+            else:
+                results = await dispatch_batches(
+                    venmo_service,
+                    batches,
+                    on_error=email_service.send_error_notification,
                 )
 
-        # Send success report if we processed any requests
-        if successful_requests:
-            email_service.send_success_report(successful_requests)
+            successful_requests = [result.request for result in results if result.success]
+            # Sharded runs report all failures at once instead of one email per request
+            failures = (
+                [result for result in results if not result.success]
+                if config.shard_count > 1
+                else []
+            )
+
+            # Send success report if we processed any requests, even if the digest fails
+            try:
+                if successful_requests:
+                    email_service.send_success_report(successful_requests)
+            finally:
+                if failures:
+                    email_service.send_error_digest(failures)
 
     except Exception as e:
         logger.error(f"Error in main: {e!s}")
@@ -1,4 +1,10 @@
-from pydantic import BaseModel, EmailStr, FilePath, SecretStr
+import tempfile
+from pathlib import Path
+
+from pydantic import BaseModel, EmailStr, FilePath, SecretStr, conint
+
+# Constants
+DEFAULT_RUN_LOCK_DIR = Path(tempfile.gettempdir()) / "venmo-requester"
 
 
 class VenmoConfig(BaseModel):
@@ -52,9 +58,15 @@ class AppConfig(BaseModel):
         email: Email service configuration
         google_sheets: Google Sheets configuration
         log_level: Logging level for the application
+        coalesce_requests: Whether to merge due rows for the same Venmo user into one request
+        shard_count: Number of worker processes to split due requests across
+        run_lock_dir: Directory holding the lock that stops overlapping runs
     """
 
     venmo: VenmoConfig
     email: EmailConfig
     google_sheets: GoogleSheetsConfig
     log_level: str = "INFO"
+    coalesce_requests: bool = False
+    shard_count: conint(ge=1) = 1
+    run_lock_dir: Path = DEFAULT_RUN_LOCK_DIR
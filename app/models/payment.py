@@ -18,6 +18,40 @@ class PaymentFrequency(str, Enum):
     YEARLY = "yearly"
 
 
+def parse_payment_date(value: str) -> tuple[int, int]:
+    """Parse a payment date into its month and day.
+
+    Args:
+        value: Either a day of the month (1-31) or a date in MM-DD format
+
+    Returns:
+        tuple[int, int]: The month (0 for monthly dates) and the day
+
+    Raises:
+        ValueError: If the payment date is empty or malformed
+    """
+    if not value:
+        raise ValueError("Payment date cannot be empty")
+
+    # Check if it's a monthly format (1-31)
+    if value.isdigit():
+        day = int(value)
+        if not MIN_DAY <= day <= MAX_DAY:
+            raise ValueError(f"Monthly payment date must be between {MIN_DAY} and {MAX_DAY}")
+        return 0, day
+
+    # Check if it's a yearly format (MM-DD)
+    if re.match(r"^\d{2}-\d{2}$", value):
+        month, day = map(int, value.split("-"))
+        if not MIN_MONTH <= month <= MAX_MONTH:
+            raise ValueError(f"Month must be between {MIN_MONTH} and {MAX_MONTH}")
+        if not MIN_DAY <= day <= MAX_DAY:
+            raise ValueError(f"Day must be between {MIN_DAY} and {MAX_DAY}")
+        return month, day
+
+    raise ValueError("Payment date must be either a day (1-31) or in MM-DD format")
+
+
 class PaymentDate(BaseModel):
     """Model representing a payment date that can be either monthly or yearly"""
 
@@ -27,26 +61,8 @@ class PaymentDate(BaseModel):
     @classmethod
     def validate_value(cls, v: str) -> str:
         """Validate the payment date format"""
-        if not v:
-            raise ValueError("Payment date cannot be empty")
-
-        # Check if it's a monthly format (1-31)
-        if v.isdigit():
-            day = int(v)
-            if not MIN_DAY <= day <= MAX_DAY:
-                raise ValueError(f"Monthly payment date must be between {MIN_DAY} and {MAX_DAY}")
-            return v
-
-        # Check if it's a yearly format (MM-DD)
-        if re.match(r"^\d{2}-\d{2}$", v):
-            month, day = map(int, v.split("-"))
-            if not MIN_MONTH <= month <= MAX_MONTH:
-                raise ValueError(f"Month must be between {MIN_MONTH} and {MAX_MONTH}")
-            if not MIN_DAY <= day <= MAX_DAY:
-                raise ValueError(f"Day must be between {MIN_DAY} and {MAX_DAY}")
-            return v
-
-        raise ValueError("Payment date must be either a day (1-31) or in MM-DD format")
+        parse_payment_date(v)
+        return v
 
 
 class PaymentRequest(BaseModel):
@@ -59,7 +75,15 @@ class PaymentRequest(BaseModel):
     payment_date: PaymentDate
 
 
+class CoalescedPaymentRequest(BaseModel):
+    """Model representing several due payment requests merged into a single Venmo request"""
+
+    request: PaymentRequest
+    sources: list[PaymentRequest]
+
+
 class PaymentResult(BaseModel):
     request: PaymentRequest
     success: bool
     error_message: str | None = None
+    outcome_unknown: bool = False  # the request may have been sent before its worker crashed
@@ -0,0 +1,33 @@
+import fcntl
+from collections.abc import Iterator
+from contextlib import contextmanager
+from pathlib import Path
+
+# Constants
+RUN_LOCK_FILE = "run.lock"
+
+
+@contextmanager
+def run_lock(lock_dir: Path) -> Iterator[bool]:
+    """Hold an exclusive file lock for a whole run.
+
+    The lock is shared by every run regardless of mode or shard count, and is
+    released by the OS if the process dies, so a crashed run never leaves it held.
+
+    Args:
+        lock_dir: Directory holding the lock file
+
+    Yields:
+        bool: True if the lock was acquired, False if another run already holds it
+    """
+    lock_dir.mkdir(parents=True, exist_ok=True)
+    with (lock_dir / RUN_LOCK_FILE).open("w") as lock_file:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            yield False
+            return
+        try:
+            yield True
+        finally:
+            fcntl.flock(lock_file, fcntl.LOCK_UN)
@@ -1,4 +1,10 @@
+import asyncio
+import logging
+import time
+from threading import Lock
+
 from magic_di import Connectable, DependencyInjector
+from pydantic import BaseModel
 
 from app.models.config import AppConfig
 from app.services.email import GmailService, IEmailService
@@ -8,14 +14,17 @@ from app.services.payment_requests import (
 )
 from app.services.venmo import IVenmoService, VenmoAPIService
 
+logger = logging.getLogger(__name__)
+
 
 class ServiceContainer(Connectable):
     """Container class that manages service instances using magic-di.
 
     This container:
     1. Configures which interfaces map to which implementations
-    2. Manages the lifecycle of our services
-    3. Provides a clean interface for accessing services
+    2. Builds each service once and caches it
+    3. Manages the lifecycle of our services
+    4. Provides a clean interface for accessing services
     """
 
     def __init__(self, config: AppConfig):
@@ -29,26 +38,64 @@ class ServiceContainer(Connectable):
                 IVenmoService: VenmoAPIService,
             },
         )
+        # Configuration section each service is built with
+        self._service_configs: dict[type, BaseModel] = {
+            IEmailService: config.email,
+            IPaymentRequestRepository: config.google_sheets,
+            IVenmoService: config.venmo,
+        }
+        self._services: dict[type, object] = {}
+        # One lock per service so slow builds still run concurrently with each other
+        self._build_locks: dict[type, Lock] = {
+            interface: Lock() for interface in self._service_configs
+        }
+        self.init_timings: dict[str, float] = {}
 
     async def __connect__(self):
-        """Initialize all services through the injector"""
-        await self._injector.connect()
+        """Build and connect all services concurrently, recording how long each one takes"""
+        await asyncio.gather(
+            *(self._connect_service(interface) for interface in self._service_configs)
+        )
 
     async def __disconnect__(self):
-        """Cleanup all services through the injector"""
-        await self._injector.disconnect()
+        """Cleanup all cached services"""
+        for service in reversed(self._services.values()):
+            if hasattr(service, "__disconnect__"):
+                try:
+                    await service.__disconnect__()
+                except Exception as e:
+                    logger.error(f"Failed to disconnect {type(service).__name__}: {e!s}")
+
+    def _get_service(self, interface: type) -> object:
+        """Get the cached service bound to an interface, building it on first use"""
+        with self._build_locks[interface]:
+            if interface not in self._services:
+                implementation = self._injector.bindings[interface]
+                self._services[interface] = implementation(self._service_configs[interface])
+            return self._services[interface]
+
+    async def _connect_service(self, interface: type) -> None:
+        """Build a service off the event loop, run its async setup and record the timing"""
+        start = time.perf_counter()
+        service = await asyncio.to_thread(self._get_service, interface)
+        if hasattr(service, "__connect__"):
+            await service.__connect__()
+        elapsed = time.perf_counter() - start
+
+        self.init_timings[interface.__name__] = elapsed
+        logger.info(f"Initialized {type(service).__name__} in {elapsed:.3f}s")
 
     @property
     def email_service(self) -> IEmailService:
         """Get the email service instance with email config"""
-        return self._injector.inject(IEmailService)(self.config.email)
+        return self._get_service(IEmailService)
 
     @property
     def payment_request_repository(self) -> IPaymentRequestRepository:
         """Get the payment request repository instance with sheets config"""
-        return self._injector.inject(IPaymentRequestRepository)(self.config.google_sheets)
+        return self._get_service(IPaymentRequestRepository)
 
     @property
     def venmo_service(self) -> IVenmoService:
         """Get the Venmo service instance with Venmo config"""
-        return self._injector.inject(IVenmoService)(self.config.venmo)
+        return self._get_service(IVenmoService)
@@ -1,6 +1,7 @@
 from typing import Protocol
 
-from app.models.payment import PaymentRequest
+from app.models.payment import PaymentRequest, PaymentResult
+from app.services.email._gmail import GmailService
 
 
 class IEmailService(Protocol):
@@ -27,5 +28,15 @@ class IEmailService(Protocol):
         """
         ...
 
+    def send_error_digest(self, failures: list[PaymentResult]) -> None:
+        """Send a single report of all failed payment requests.
 
-__all__ = ["IEmailService"]
+        Requests whose outcome is unknown are listed apart from confirmed failures.
+
+        Args:
+            failures: List of failed payment results to report
+        """
+        ...
+
+
+__all__ = ["GmailService", "IEmailService"]
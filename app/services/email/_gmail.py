@@ -5,7 +5,7 @@ from email.mime.text import MIMEText
 
 # Local application imports
 from app.models.config import EmailConfig
-from app.models.payment import PaymentRequest
+from app.models.payment import PaymentRequest, PaymentResult
 
 
 class GmailService:
@@ -98,7 +98,7 @@ class GmailService:
 
             """
             for payment in payments:
-                body += f"- {payment.user_id}: ${payment.amount:.2f} for {payment.note}\n"
+                body += f"- {payment.venmo_id}: ${payment.amount:.2f} for {payment.note}\n"
 
             msg.attach(MIMEText(body, "plain"))
 
@@ -110,3 +110,63 @@ class GmailService:
 
         except Exception as e:
             raise RuntimeError(f"Failed to send success report email: {e!s}")
+
+    def send_error_digest(self, failures: list[PaymentResult]) -> None:
+        """Send a single report of all failed payment requests using Gmail SMTP.
+
+        This method:
+        1. Creates a multipart email message
+        2. Sets up the email content with one line per failed request, listing
+           requests whose outcome is unknown separately
+        3. Connects to Gmail SMTP server
+        4. Sends the email
+
+        Args:
+            failures: List of failed payment results to report
+
+        Raises:
+            RuntimeError: If there's an error sending the email
+        """
+        try:
+            # Create message
+            msg = MIMEMultipart()
+            msg["From"] = self.config.smtp_user
+            msg["To"] = self.config.notification_email
+            msg["Subject"] = "Venmo Auto Request: Error Digest"
+
+            # Create email body, keeping rows that may have been sent apart from confirmed failures
+            failed = [failure for failure in failures if not failure.outcome_unknown]
+            unknown = [failure for failure in failures if failure.outcome_unknown]
+            body = """
+            The following payment requests failed:
+
+            """
+            body += self._format_failures(failed) or "(none)\n"
+            if unknown:
+                body += """
+            The outcome of the following payment requests is unknown.
+            Check Venmo before requesting them again:
+
+            """
+                body += self._format_failures(unknown)
+
+            msg.attach(MIMEText(body, "plain"))
+
+            # Send email
+            with smtplib.SMTP(self.smtp_server, self.smtp_port) as server:
+                server.starttls()
+                server.login(self.config.smtp_user, self.config.smtp_app_password)
+                server.send_message(msg)
+
+        except Exception as e:
+            raise RuntimeError(f"Failed to send error digest email: {e!s}")
+
+    @staticmethod
+    def _format_failures(failures: list[PaymentResult]) -> str:
+        """Format one line per failed payment request."""
+        lines = ""
+        for failure in failures:
+            payment = failure.request
+            error = failure.error_message or "request was not accepted"
+            lines += f"- {payment.venmo_id}: ${payment.amount:.2f} for {payment.note} ({error})\n"
+        return lines
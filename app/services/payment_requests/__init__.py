@@ -1,6 +1,8 @@
 from typing import Protocol
 
 from app.models.payment import PaymentRequest
+from app.services.payment_requests._coalesce import coalesce_payment_requests, fan_out_result
+from app.services.payment_requests._google_sheets import GoogleSheetsPaymentRequestRepository
 
 
 class IPaymentRequestRepository(Protocol):
@@ -19,4 +21,9 @@ class IPaymentRequestRepository(Protocol):
         ...
 
 
-__all__ = ["IPaymentRequestRepository"]
+__all__ = [
+    "GoogleSheetsPaymentRequestRepository",
+    "IPaymentRequestRepository",
+    "coalesce_payment_requests",
+    "fan_out_result",
+]
@@ -0,0 +1,102 @@
+# Standard library imports
+from decimal import Decimal
+
+# Local application imports
+from app.models.payment import CoalescedPaymentRequest, PaymentRequest, PaymentResult
+
+# Constants
+MAX_NOTE_LENGTH = 280  # Keep merged notes short enough to read in the Venmo app
+NOTE_SEPARATOR = ", "
+NOTE_ELLIPSIS = "..."
+
+
+def _join_notes(notes: list[str], max_length: int) -> str:
+    """Join notes with a separator, truncating the result to fit within max_length.
+
+    Args:
+        notes: Notes to join, in sheet order
+        max_length: Maximum length of the joined note
+
+    Returns:
+        str: The joined note, ending in an ellipsis if it had to be truncated
+    """
+    note = NOTE_SEPARATOR.join(notes)
+    if len(note) <= max_length:
+        return note
+    return note[: max_length - len(NOTE_ELLIPSIS)].rstrip() + NOTE_ELLIPSIS
+
+
+def coalesce_payment_requests(
+    requests: list[PaymentRequest],
+    max_note_length: int = MAX_NOTE_LENGTH,
+) -> list[CoalescedPaymentRequest]:
+    """Merge due payment requests for the same Venmo user into a single request.
+
+    This function:
+    1. Groups requests by venmo_id, keeping the order in which users first appear
+    2. Sums the Decimal amounts of each group exactly
+    3. Joins the notes of each group within the note length limit
+
+    Frequency and payment date are taken from the first row of each group; every
+    row passed in is expected to be due today.
+
+    Args:
+        requests: Payment requests that are due today
+        max_note_length: Maximum length of a merged note
+
+    Returns:
+        list[CoalescedPaymentRequest]: One merged request per Venmo user, with its source rows
+
+    Raises:
+        ValueError: If max_note_length is too short to hold the truncation ellipsis
+    """
+    if max_note_length < len(NOTE_ELLIPSIS):
+        raise ValueError(f"max_note_length must be at least {len(NOTE_ELLIPSIS)}")
+
+    groups: dict[str, list[PaymentRequest]] = {}
+    for request in requests:
+        groups.setdefault(request.venmo_id, []).append(request)
+
+    coalesced = []
+    for sources in groups.values():
+        first = sources[0]
+        if len(sources) == 1:
+            merged = first
+        else:
+            merged = first.model_copy(
+                update={
+                    "amount": sum((source.amount for source in sources), Decimal(0)),
+                    "note": _join_notes([source.note for source in sources], max_note_length),
+                },
+            )
+        coalesced.append(CoalescedPaymentRequest(request=merged, sources=sources))
+
+    return coalesced
+
+
+def fan_out_result(
+    coalesced: CoalescedPaymentRequest,
+    success: bool,
+    error_message: str | None = None,
+    outcome_unknown: bool = False,
+) -> list[PaymentResult]:
+    """Expand the outcome of a merged request into one result per source row.
+
+    Args:
+        coalesced: The merged request that was sent
+        success: Whether the merged request succeeded
+        error_message: Error message for the merged request, if any
+        outcome_unknown: Whether the request may have been sent despite not being confirmed
+
+    Returns:
+        list[PaymentResult]: One result per source row, sharing the merged outcome
+    """
+    return [
+        PaymentResult(
+            request=source,
+            success=success,
+            error_message=error_message,
+            outcome_unknown=outcome_unknown,
+        )
+        for source in coalesced.sources
+    ]
@@ -1,6 +1,6 @@
 # Standard library imports
 from datetime import datetime
-from decimal import Decimal
+from decimal import Decimal, InvalidOperation
 
 # Third-party imports
 from google.oauth2.service_account import Credentials as ServiceAccountCredentials
@@ -10,6 +10,7 @@ from googleapiclient.errors import HttpError
 # Local application imports
 from app.models.config import GoogleSheetsConfig
 from app.models.payment import PaymentDate, PaymentFrequency, PaymentRequest
+from app.services.payment_requests._schedule import due_schedule_keys, schedule_key
 
 # Constants
 REQUIRED_COLUMNS = 5  # venmo_id, note, amount, frequency, payment_date
@@ -21,8 +22,8 @@ class GoogleSheetsPaymentRequestRepository:
     This implementation:
     1. Handles Google Sheets API authentication
     2. Retrieves and parses payment request data
-    3. Converts raw data into PaymentRequest objects
-    4. Filters requests based on current date and frequency
+    3. Filters rows based on current date and frequency
+    4. Converts only the due rows into PaymentRequest objects
     """
 
     def __init__(self, config: GoogleSheetsConfig):
@@ -46,10 +47,10 @@ class GoogleSheetsPaymentRequestRepository:
 
         This method:
         1. Reads data from the configured spreadsheet
-        2. Parses the data into PaymentRequest objects
-        3. Filters requests based on current date and frequency:
+        2. Checks each row's packed schedule key against today's date, based on frequency:
             - Monthly requests: processed on the specified day of the month
             - Yearly requests: processed on the specified month and day
+        3. Parses only the due rows into PaymentRequest objects
 
         Returns:
             list[PaymentRequest]: List of PaymentRequest objects that should be processed today
@@ -77,38 +78,33 @@ class GoogleSheetsPaymentRequestRepository:
             # Skip header row
             rows = values[1:]
 
-            # Get current date for filtering
-            today = datetime.now()
+            # Get the schedule keys that are due today
+            due_keys = due_schedule_keys(datetime.now().date())
 
-            # Parse rows into PaymentRequest objects
+            # Parse due rows into PaymentRequest objects
             payment_requests = []
             for row in rows:
                 if len(row) >= REQUIRED_COLUMNS:  # Ensure we have all required columns
                     try:
+                        # Skip rows that should not be processed today before building a model
+                        frequency = PaymentFrequency(row[3].lower())
+                        if schedule_key(frequency, row[4]) not in due_keys:
+                            continue
+
                         # Parse amount by removing $ and converting to Decimal
                         amount = Decimal(row[2].replace("$", ""))
 
-                        # Create payment request
-                        request = PaymentRequest(
-                            venmo_id=row[0],
-                            note=row[1],
-                            amount=amount,
-                            frequency=PaymentFrequency(row[3].lower()),
-                            payment_date=PaymentDate(value=row[4]),
+                        payment_requests.append(
+                            PaymentRequest(
+                                venmo_id=row[0],
+                                note=row[1],
+                                amount=amount,
+                                frequency=frequency,
+                                payment_date=PaymentDate(value=row[4]),
+                            ),
                         )
 
-                        # Check if this request should be processed today
-                        should_process = False
-                        if request.frequency == PaymentFrequency.MONTHLY:
-                            should_process = today.day == int(request.payment_date.value)
-                        elif request.frequency == PaymentFrequency.YEARLY:
-                            month, day = map(int, request.payment_date.value.split("-"))
-                            should_process = today.month == month and today.day == day
-
-                        if should_process:
-                            payment_requests.append(request)
-
-                    except (ValueError, IndexError) as e:
+                    except (ValueError, IndexError, InvalidOperation) as e:
                         print(f"Error parsing row {row}: {e}")
                         continue
 
@@ -0,0 +1,47 @@
+# Standard library imports
+from datetime import date
+
+# Local application imports
+from app.models.payment import PaymentFrequency, parse_payment_date
+
+# Constants
+DAY_BITS = 5  # days 1-31 fit in the low 5 bits of a packed schedule key
+
+
+def _pack(month: int, day: int) -> int:
+    """Pack a month (0 for monthly dates) and a day into a single schedule key."""
+    return (month << DAY_BITS) | day
+
+
+def schedule_key(frequency: PaymentFrequency, payment_date: str) -> int:
+    """Pack the payment date of a schedule row into a single integer key.
+
+    Args:
+        frequency: How often the payment is requested
+        payment_date: Either a day of the month (1-31) or a date in MM-DD format
+
+    Returns:
+        int: The packed month (0 for monthly rows) and day
+
+    Raises:
+        ValueError: If the payment date is malformed or does not match the frequency
+    """
+    month, day = parse_payment_date(payment_date)
+    if (frequency == PaymentFrequency.MONTHLY) != (month == 0):
+        raise ValueError(f"Payment date {payment_date} does not match {frequency.value}")
+    return _pack(month, day)
+
+
+def due_schedule_keys(today: date) -> set[int]:
+    """Get the schedule keys of every row due on the given date.
+
+    Monthly rows match on the day of the month and yearly rows on the month and
+    day, so checking a row is a single set lookup on its schedule key.
+
+    Args:
+        today: The date to select rows for
+
+    Returns:
+        set[int]: The keys of due monthly and yearly rows
+    """
+    return {_pack(0, today.day), _pack(today.month, today.day)}
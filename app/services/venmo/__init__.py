@@ -1,5 +1,7 @@
 from typing import Protocol
 
+from app.services.venmo._api import VenmoAPIService
+
 
 class IVenmoService(Protocol):
     """Interface defining the contract for Venmo service implementations.
@@ -41,4 +43,4 @@ class IVenmoService(Protocol):
         ...
 
 
-__all__ = ["IVenmoService"]
+__all__ = ["IVenmoService", "VenmoAPIService"]
@@ -0,0 +1,173 @@
+import asyncio
+import hashlib
+import logging
+import multiprocessing
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+from app.dispatch import dispatch_batches
+from app.models.config import AppConfig, VenmoConfig
+from app.models.payment import CoalescedPaymentRequest, PaymentResult
+from app.services.payment_requests import fan_out_result
+from app.services.venmo import IVenmoService, VenmoAPIService
+
+logger = logging.getLogger(__name__)
+
+
+def shard_for(venmo_id: str, shard_count: int) -> int:
+    """Pick the shard for a Venmo user using a hash that is stable across processes.
+
+    Args:
+        venmo_id: The Venmo user ID to place
+        shard_count: Total number of shards
+
+    Returns:
+        int: The shard index, between 0 and shard_count - 1
+    """
+    digest = hashlib.sha256(venmo_id.encode()).digest()
+    return int.from_bytes(digest[:8], "big") % shard_count
+
+
+def partition_batches(
+    batches: list[CoalescedPaymentRequest],
+    shard_count: int,
+) -> list[list[CoalescedPaymentRequest]]:
+    """Split batches into shards so that each Venmo user lands in exactly one shard.
+
+    Args:
+        batches: Requests to split
+        shard_count: Total number of shards
+
+    Returns:
+        list[list[CoalescedPaymentRequest]]: The batches of each shard, in their original order
+    """
+    shards: list[list[CoalescedPaymentRequest]] = [[] for _ in range(shard_count)]
+    for batch in batches:
+        shards[shard_for(batch.request.venmo_id, shard_count)].append(batch)
+    return shards
+
+
+def _fail_shard(
+    shard_index: int,
+    batches: list[CoalescedPaymentRequest],
+    error: Exception,
+) -> list[PaymentResult]:
+    """Fail every row of a shard whose Venmo service could not be set up."""
+    logger.error(f"Shard {shard_index} failed: {error!s}")
+    return [
+        result
+        for batch in batches
+        for result in fan_out_result(batch, False, f"Shard {shard_index} failed: {error!s}")
+    ]
+
+
+async def _process_shard(
+    venmo_service_factory: Callable[[VenmoConfig], IVenmoService],
+    venmo_config: VenmoConfig,
+    shard_index: int,
+    batches: list[CoalescedPaymentRequest],
+) -> list[PaymentResult]:
+    """Send the requests of one shard, returning results instead of raising.
+
+    Setup errors happen before any request is sent, so they are reported as
+    confirmed failures. Disconnect errors are only logged, so the results of
+    requests that were already sent are never lost.
+    """
+    try:
+        venmo_service = venmo_service_factory(venmo_config)
+        if hasattr(venmo_service, "__connect__"):
+            await venmo_service.__connect__()
+    except Exception as e:
+        return _fail_shard(shard_index, batches, e)
+
+    try:
+        return await dispatch_batches(venmo_service, batches)
+    finally:
+        if hasattr(venmo_service, "__disconnect__"):
+            try:
+                await venmo_service.__disconnect__()
+            except Exception as e:
+                logger.error(f"Failed to disconnect Venmo service in shard {shard_index}: {e!s}")
+
+
+def run_shard(
+    venmo_service_factory: Callable[[VenmoConfig], IVenmoService],
+    venmo_config: VenmoConfig,
+    shard_index: int,
+    batches: list[CoalescedPaymentRequest],
+) -> list[PaymentResult]:
+    """Process one shard inside a worker process.
+
+    Only the Venmo service is built here; the sheet has already been read and
+    reports are sent by the parent process.
+
+    Args:
+        venmo_service_factory: Builds the Venmo service from its config
+        venmo_config: Venmo API configuration
+        shard_index: Index of the shard being processed
+        batches: Requests belonging to the shard
+
+    Returns:
+        list[PaymentResult]: One result per source row of the shard
+    """
+    logging.basicConfig(level=logging.INFO)
+    logger.info(f"Processing shard {shard_index} with {len(batches)} requests")
+    return asyncio.run(_process_shard(venmo_service_factory, venmo_config, shard_index, batches))
+
+
+async def run_sharded(
+    config: AppConfig,
+    batches: list[CoalescedPaymentRequest],
+    venmo_service_factory: Callable[[VenmoConfig], IVenmoService] = VenmoAPIService,
+) -> list[PaymentResult]:
+    """Send requests across config.shard_count worker processes and merge their results.
+
+    This function:
+    1. Splits the batches by a stable hash of venmo_id
+    2. Runs each non-empty shard in its own worker process and event loop
+    3. Merges the per-shard results
+
+    Workers report their own failures, so an exception here means the worker
+    died mid-shard (e.g. BrokenProcessPool). Some of its requests may already
+    have been sent, so its rows are marked as outcome unknown rather than failed.
+
+    Args:
+        config: Application configuration
+        batches: Requests to send
+        venmo_service_factory: Picklable callable that builds the Venmo service in each worker
+
+    Returns:
+        list[PaymentResult]: One result per source row across all shards
+    """
+    shards = {
+        index: shard
+        for index, shard in enumerate(partition_batches(batches, config.shard_count))
+        if shard
+    }
+
+    loop = asyncio.get_running_loop()
+    with ProcessPoolExecutor(
+        max_workers=max(len(shards), 1),
+        mp_context=multiprocessing.get_context("spawn"),
+    ) as pool:
+        outcomes = await asyncio.gather(
+            *(
+                loop.run_in_executor(
+                    pool, run_shard, venmo_service_factory, config.venmo, index, shard
+                )
+                for index, shard in shards.items()
+            ),
+            return_exceptions=True,
+        )
+
+    results: list[PaymentResult] = []
+    for (index, shard), outcome in zip(shards.items(), outcomes, strict=True):
+        if isinstance(outcome, BaseException):
+            error_message = f"Shard {index} crashed, outcome unknown: {outcome!s}"
+            logger.error(error_message)
+            for batch in shard:
+                results.extend(fan_out_result(batch, False, error_message, outcome_unknown=True))
+        else:
+            results.extend(outcome)
+
+    return results
@@ -1,5 +1,12 @@
 import os
 import sys
+from collections.abc import Callable
+from decimal import Decimal
+
+import pytest
+
+from app.models.config import AppConfig, EmailConfig, GoogleSheetsConfig, VenmoConfig
+from app.models.payment import PaymentDate, PaymentFrequency, PaymentRequest
 
 # Calculate the path to the projects root directory
 project_root = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
@@ -10,3 +17,65 @@ sys.path.insert(0, app_path)
 
 # set the environment to test
 os.environ["ENVIRONMENT"] = "test"
+
+
+@pytest.fixture
+def make_payment_request() -> Callable[..., PaymentRequest]:
+    """Factory for monthly payment requests due on the 1st."""
+
+    def _make(venmo_id: str, amount: str = "10.00", note: str = "Rent") -> PaymentRequest:
+        return PaymentRequest(
+            venmo_id=venmo_id,
+            amount=Decimal(amount),
+            note=note,
+            frequency=PaymentFrequency.MONTHLY,
+            payment_date=PaymentDate(value="1"),
+        )
+
+    return _make
+
+
+class StubVenmoService:
+    """Venmo service stub: rejects users named reject-*, raises for users named error-*."""
+
+    def __init__(self, config: VenmoConfig):
+        self.config = config
+
+    async def request_payment(self, user_id: str, amount: float, note: str) -> bool:
+        if user_id.startswith("error"):
+            raise RuntimeError(f"Venmo API error for {user_id}")
+        return not user_id.startswith("reject")
+
+
+class CrashingVenmoService(StubVenmoService):
+    """Venmo service stub whose worker process dies while sending a request."""
+
+    async def request_payment(self, user_id: str, amount: float, note: str) -> bool:
+        os._exit(1)
+
+
+class BrokenVenmoService:
+    """Venmo service stub that cannot be built, e.g. because of a bad token."""
+
+    def __init__(self, config: VenmoConfig):
+        raise RuntimeError("invalid access token")
+
+
+@pytest.fixture
+def app_config(tmp_path) -> AppConfig:
+    """Application configuration pointing at a throwaway credentials file and lock dir."""
+    credentials_path = tmp_path / "credentials.json"
+    credentials_path.write_text("{}")
+    return AppConfig(
+        venmo=VenmoConfig(access_token="token", client_id="id", client_secret="secret"),
+        email=EmailConfig(
+            smtp_user="sender@example.com",
+            smtp_app_password="password",
+            notification_email="owner@example.com",
+        ),
+        google_sheets=GoogleSheetsConfig(
+            credentials_path=credentials_path,
+            spreadsheet_id="spreadsheet",
+        ),
+        run_lock_dir=tmp_path / "locks",
+    )
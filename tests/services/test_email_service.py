@@ -0,0 +1,53 @@
+from app.models.payment import PaymentResult
+from app.services.email import GmailService
+
+
+class FakeSMTP:
+    sent = []
+
+    def __init__(self, server, port):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *args):
+        return False
+
+    def starttls(self):
+        pass
+
+    def login(self, user, password):
+        pass
+
+    def send_message(self, msg):
+        self.sent.append(msg)
+
+
+def it_should_send_one_digest_for_all_failures(monkeypatch, app_config, make_payment_request):
+    monkeypatch.setattr("app.services.email._gmail.smtplib.SMTP", FakeSMTP)
+    FakeSMTP.sent = []
+    failures = [
+        PaymentResult(request=make_payment_request("reject-me"), success=False),
+        PaymentResult(
+            request=make_payment_request("error-me", "12.50", "Gas"),
+            success=False,
+            error_message="Venmo API error",
+        ),
+        PaymentResult(
+            request=make_payment_request("crashed-me", "5.00", "Water"),
+            success=False,
+            error_message="Shard 1 crashed, outcome unknown",
+            outcome_unknown=True,
+        ),
+    ]
+
+    GmailService(app_config.email).send_error_digest(failures)
+
+    assert len(FakeSMTP.sent) == 1
+    body = FakeSMTP.sent[0].get_payload()[0].get_payload()
+    assert "- reject-me: $10.00 for Rent (request was not accepted)" in body
+    assert "- error-me: $12.50 for Gas (Venmo API error)" in body
+    failed, unknown = body.split("outcome of the following payment requests is unknown")
+    assert "crashed-me" not in failed
+    assert "- crashed-me: $5.00 for Water (Shard 1 crashed, outcome unknown)" in unknown
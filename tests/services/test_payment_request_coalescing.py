@@ -0,0 +1,51 @@
+from decimal import Decimal
+
+import pytest
+
+from app.services.payment_requests import coalesce_payment_requests, fan_out_result
+
+
+def it_should_merge_rows_for_the_same_user(make_payment_request):
+    requests = [
+        make_payment_request("george-bush-2", "3000.00", "Rent"),
+        make_payment_request("barack-obama", "100.00", "Costco"),
+        make_payment_request("george-bush-2", "500.10", "Utilities"),
+    ]
+
+    coalesced = coalesce_payment_requests(requests)
+
+    assert [c.request.venmo_id for c in coalesced] == ["george-bush-2", "barack-obama"]
+    assert coalesced[0].request.amount == Decimal("3500.10")
+    assert coalesced[0].request.note == "Rent, Utilities"
+    assert coalesced[0].sources == [requests[0], requests[2]]
+    assert coalesced[1].request == requests[1]
+
+
+def it_should_truncate_merged_notes(make_payment_request):
+    requests = [make_payment_request("george-bush-2", "1.00", "x" * 10) for _ in range(3)]
+    max_note_length = 20
+
+    coalesced = coalesce_payment_requests(requests, max_note_length=max_note_length)
+
+    assert len(coalesced[0].request.note) == max_note_length
+    assert coalesced[0].request.note.endswith("...")
+
+
+def it_should_reject_a_note_limit_shorter_than_the_ellipsis(make_payment_request):
+    requests = [make_payment_request("george-bush-2", note="abcdef")]
+
+    with pytest.raises(ValueError):
+        coalesce_payment_requests(requests, max_note_length=2)
+
+
+def it_should_fan_out_results_to_source_rows(make_payment_request):
+    requests = [
+        make_payment_request("george-bush-2", "1.00", "Rent"),
+        make_payment_request("george-bush-2", "2.00", "Gas"),
+    ]
+    coalesced = coalesce_payment_requests(requests)[0]
+
+    results = fan_out_result(coalesced, False, "boom")
+
+    assert [r.request for r in results] == requests
+    assert all(not r.success and r.error_message == "boom" for r in results)
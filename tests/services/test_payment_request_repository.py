@@ -1,2 +1,70 @@
+import asyncio
+from datetime import date, datetime
+from decimal import Decimal
+from unittest.mock import MagicMock
+
+import pytest
+
+from app.models.payment import PaymentFrequency
+from app.services.payment_requests import GoogleSheetsPaymentRequestRepository, _google_sheets
+from app.services.payment_requests._schedule import due_schedule_keys, schedule_key
+
+
+class FixedDatetime(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return cls(2025, 4, 20, 10)
+
+
+@pytest.fixture
+def repository(monkeypatch, app_config) -> GoogleSheetsPaymentRequestRepository:
+    monkeypatch.setattr(_google_sheets, "ServiceAccountCredentials", MagicMock())
+    monkeypatch.setattr(_google_sheets, "build", MagicMock())
+    monkeypatch.setattr(_google_sheets, "datetime", FixedDatetime)
+    return GoogleSheetsPaymentRequestRepository(app_config.google_sheets)
+
+
+def _with_rows(repository, rows):
+    get = repository._service.spreadsheets.return_value.values.return_value.get
+    get.return_value.execute.return_value = {"values": [["Username"], *rows]}
+    return repository
+
+
 def it_should_pass():
     assert True
+
+
+def it_should_return_only_valid_rows_due_today(repository):
+    rows = [
+        ["george-bush-2", "Rent", "$3000", "Monthly", "20"],
+        ["barack-obama", "Costco", "$99.99", "Yearly", "04-20"],
+        ["donald-trump", "YouTube", "$125", "Monthly", "10"],  # not due today
+        ["bill-clinton-69", "Netflix", "abc", "Monthly", "20"],  # bad amount
+        ["hillary-clinton", "Gas", "$0", "Monthly", "20"],  # non-positive amount
+        ["joe-biden", "Phone", "$NaN", "Monthly", "20"],  # non-finite amount
+        ["jimmy-carter", "Water", "$10", "Monthly", "04-20"],  # date does not match frequency
+        ["ronald-reagan", "Power", "$10"],  # missing columns
+    ]
+
+    requests = asyncio.run(_with_rows(repository, rows).get_payment_requests())
+
+    assert [(r.venmo_id, r.amount, r.frequency) for r in requests] == [
+        ("george-bush-2", Decimal("3000"), PaymentFrequency.MONTHLY),
+        ("barack-obama", Decimal("99.99"), PaymentFrequency.YEARLY),
+    ]
+
+
+def it_should_return_nothing_for_an_empty_sheet(repository):
+    get = repository._service.spreadsheets.return_value.values.return_value.get
+    get.return_value.execute.return_value = {}
+
+    assert asyncio.run(repository.get_payment_requests()) == []
+
+
+def it_should_match_schedule_keys_to_the_due_date():
+    due_keys = due_schedule_keys(date(2025, 4, 20))
+
+    assert schedule_key(PaymentFrequency.MONTHLY, "20") in due_keys
+    assert schedule_key(PaymentFrequency.YEARLY, "04-20") in due_keys
+    assert schedule_key(PaymentFrequency.YEARLY, "05-20") not in due_keys
+    assert schedule_key(PaymentFrequency.MONTHLY, "21") not in due_keys
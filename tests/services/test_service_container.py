@@ -0,0 +1,81 @@
+import asyncio
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from app.services.container import ServiceContainer
+from app.services.email import IEmailService
+from app.services.payment_requests import IPaymentRequestRepository
+from app.services.venmo import IVenmoService
+
+
+class FakeService:
+    instances = 0
+
+    def __init__(self, config):
+        type(self).instances += 1
+        self.config = config
+        self.connected = False
+
+    async def __connect__(self):
+        self.connected = True
+
+    async def __disconnect__(self):
+        self.connected = False
+
+
+class SlowService(FakeService):
+    def __init__(self, config):
+        time.sleep(0.05)
+        super().__init__(config)
+
+
+def _container(app_config) -> ServiceContainer:
+    container = ServiceContainer(app_config)
+    container._injector.bind(
+        {
+            IEmailService: FakeService,
+            IPaymentRequestRepository: FakeService,
+            IVenmoService: FakeService,
+        },
+    )
+    return container
+
+
+def it_should_build_each_service_once(app_config):
+    FakeService.instances = 0
+    container = _container(app_config)
+
+    assert container.email_service is container.email_service
+    assert container.venmo_service is container.venmo_service
+    assert container.venmo_service.config is container.config.venmo
+    assert FakeService.instances == len({IEmailService, IVenmoService})
+
+
+def it_should_connect_services_and_record_timings(app_config):
+    container = _container(app_config)
+
+    asyncio.run(container.__connect__())
+
+    assert container.payment_request_repository.connected
+    assert container.payment_request_repository.config is container.config.google_sheets
+    assert set(container.init_timings) == {
+        "IEmailService",
+        "IPaymentRequestRepository",
+        "IVenmoService",
+    }
+
+    asyncio.run(container.__disconnect__())
+
+    assert not container.email_service.connected
+
+
+def it_should_build_once_when_threads_race(app_config):
+    SlowService.instances = 0
+    container = _container(app_config)
+    container._injector.bind({IVenmoService: SlowService})
+
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        services = list(pool.map(lambda _: container.venmo_service, range(4)))
+
+    assert SlowService.instances == 1
+    assert all(service is services[0] for service in services)
@@ -0,0 +1,34 @@
+import asyncio
+
+from conftest import StubVenmoService
+
+from app.dispatch import dispatch_batches
+from app.services.payment_requests import coalesce_payment_requests
+
+
+def it_should_fan_out_success_rejection_and_errors(app_config, make_payment_request):
+    requests = [
+        make_payment_request("george-bush-2", note="Rent"),
+        make_payment_request("reject-me"),
+        make_payment_request("error-me"),
+        make_payment_request("george-bush-2", note="Utilities"),
+    ]
+    errors = []
+
+    results = asyncio.run(
+        dispatch_batches(
+            StubVenmoService(app_config.venmo),
+            coalesce_payment_requests(requests),
+            on_error=lambda error, context: errors.append((str(error), context)),
+        ),
+    )
+
+    assert [(r.request, r.success) for r in results] == [
+        (requests[0], True),
+        (requests[3], True),
+        (requests[1], False),
+        (requests[2], False),
+    ]
+    assert results[2].error_message is None
+    assert results[3].error_message == "Venmo API error for error-me"
+    assert errors == [("Venmo API error for error-me", "processing request for error-me")]
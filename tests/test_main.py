@@ -0,0 +1,145 @@
+import asyncio
+from decimal import Decimal
+
+import pytest
+from conftest import StubVenmoService
+
+import app.main
+from app.run_lock import run_lock
+from app.sharding import run_sharded
+
+
+class RecordingEmailService:
+    def __init__(self):
+        self.errors = []
+        self.digests = []
+        self.reports = []
+
+    def send_error_notification(self, error, context):
+        self.errors.append((str(error), context))
+
+    def send_success_report(self, payments):
+        self.reports.append(payments)
+
+    def send_error_digest(self, failures):
+        self.digests.append(failures)
+
+
+class FakeRepository:
+    def __init__(self, requests):
+        self.requests = requests
+        self.reads = 0
+
+    async def get_payment_requests(self):
+        self.reads += 1
+        return self.requests
+
+
+class CountingVenmoService(StubVenmoService):
+    def __init__(self, config):
+        super().__init__(config)
+        self.calls = []
+
+    async def request_payment(self, user_id, amount, note):
+        self.calls.append((user_id, amount, note))
+        return await super().request_payment(user_id, amount, note)
+
+
+class FakeContainer:
+    def __init__(self, config, requests):
+        self.email_service = RecordingEmailService()
+        self.payment_request_repository = FakeRepository(requests)
+        self.venmo_service = CountingVenmoService(config.venmo)
+
+    async def __connect__(self):
+        pass
+
+
+@pytest.fixture
+def run_main(monkeypatch, app_config):
+    def _run(requests, **config_updates):
+        config = app_config.model_copy(update=config_updates)
+        container = FakeContainer(config, requests)
+        monkeypatch.setattr(app.main, "create_config", lambda: config)
+        monkeypatch.setattr(app.main, "ServiceContainer", lambda _: container)
+        monkeypatch.setattr(
+            app.main,
+            "run_sharded",
+            lambda config, batches: run_sharded(config, batches, StubVenmoService),
+        )
+        asyncio.run(app.main.main())
+        return container
+
+    return _run
+
+
+def it_should_report_each_error_when_not_sharded(run_main, make_payment_request):
+    requests = [make_payment_request("george-bush-2"), make_payment_request("error-me")]
+
+    container = run_main(requests)
+
+    email_service = container.email_service
+    assert email_service.reports == [[requests[0]]]
+    assert email_service.errors == [
+        ("Venmo API error for error-me", "processing request for error-me")
+    ]
+    assert email_service.digests == []
+
+
+def it_should_send_one_request_per_user_when_coalescing(run_main, make_payment_request):
+    requests = [
+        make_payment_request("george-bush-2", "3000.00", "Rent"),
+        make_payment_request("george-bush-2", "500.00", "Utilities"),
+    ]
+
+    container = run_main(requests, coalesce_requests=True)
+
+    assert container.venmo_service.calls == [
+        ("george-bush-2", Decimal("3500.00"), "Rent, Utilities"),
+    ]
+    assert container.email_service.reports == [requests]
+
+
+def it_should_send_one_digest_when_sharded(run_main, make_payment_request):
+    requests = [
+        make_payment_request("george-bush-2"),
+        make_payment_request("reject-me"),
+        make_payment_request("error-me"),
+    ]
+
+    container = run_main(requests, shard_count=2)
+
+    email_service = container.email_service
+    assert email_service.reports == [[requests[0]]]
+    assert email_service.errors == []
+    assert len(email_service.digests) == 1
+    assert sorted(r.request.venmo_id for r in email_service.digests[0]) == ["error-me", "reject-me"]
+
+
+def it_should_send_the_success_report_even_if_the_digest_fails(
+    monkeypatch, run_main, make_payment_request
+):
+    def fail_digest(self, failures):
+        raise RuntimeError("Failed to send error digest email: SMTP down")
+
+    monkeypatch.setattr(RecordingEmailService, "send_error_digest", fail_digest)
+    requests = [make_payment_request("george-bush-2"), make_payment_request("error-me")]
+
+    container = run_main(requests, shard_count=2)
+
+    email_service = container.email_service
+    assert email_service.reports == [[requests[0]]]
+    assert email_service.errors == [
+        ("Failed to send error digest email: SMTP down", "main execution"),
+    ]
+
+
+def it_should_skip_the_run_while_another_run_holds_the_lock(
+    run_main, app_config, make_payment_request
+):
+    with run_lock(app_config.run_lock_dir):
+        container = run_main([make_payment_request("george-bush-2")], shard_count=2)
+
+    assert container.payment_request_repository.reads == 0
+    assert container.email_service.reports == []
+    assert container.email_service.errors == []
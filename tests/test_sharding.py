@@ -0,0 +1,88 @@
+import asyncio
+
+from conftest import BrokenVenmoService, CrashingVenmoService, StubVenmoService
+
+from app.run_lock import run_lock
+from app.services.payment_requests import coalesce_payment_requests
+from app.sharding import partition_batches, run_sharded, shard_for
+
+
+def it_should_place_each_user_on_a_stable_shard():
+    shard_count = 4
+
+    assert shard_for("george-bush-2", shard_count) == shard_for("george-bush-2", shard_count)
+    assert all(0 <= shard_for(f"user-{i}", shard_count) < shard_count for i in range(100))
+
+
+def it_should_partition_every_batch_exactly_once(make_payment_request):
+    shard_count = 3
+    batches = coalesce_payment_requests([make_payment_request(f"user-{i}") for i in range(20)])
+
+    shards = partition_batches(batches, shard_count)
+
+    assert len(shards) == shard_count
+    assert sorted(b.request.venmo_id for s in shards for b in s) == sorted(
+        b.request.venmo_id for b in batches
+    )
+    for index, shard in enumerate(shards):
+        assert all(shard_for(b.request.venmo_id, shard_count) == index for b in shard)
+
+
+def it_should_merge_results_from_every_shard(app_config, make_payment_request):
+    config = app_config.model_copy(update={"shard_count": 3})
+    requests = [
+        *(make_payment_request(f"user-{i}") for i in range(6)),
+        make_payment_request("reject-me"),
+        make_payment_request("error-me"),
+    ]
+
+    results = asyncio.run(
+        run_sharded(config, coalesce_payment_requests(requests), StubVenmoService),
+    )
+
+    outcomes = {r.request.venmo_id: (r.success, r.error_message) for r in results}
+    assert len(results) == len(requests)
+    assert all(outcomes[f"user-{i}"] == (True, None) for i in range(6))
+    assert outcomes["reject-me"] == (False, None)
+    assert outcomes["error-me"] == (False, "Venmo API error for error-me")
+
+
+def it_should_fail_every_row_of_a_shard_that_cannot_run(app_config, make_payment_request):
+    config = app_config.model_copy(update={"shard_count": 2})
+    requests = [make_payment_request(f"user-{i}") for i in range(4)]
+
+    results = asyncio.run(
+        run_sharded(config, coalesce_payment_requests(requests), BrokenVenmoService),
+    )
+
+    assert sorted(r.request.venmo_id for r in results) == [f"user-{i}" for i in range(4)]
+    for result in results:
+        shard = shard_for(result.request.venmo_id, config.shard_count)
+        assert not result.success
+        assert not result.outcome_unknown
+        assert result.error_message == f"Shard {shard} failed: invalid access token"
+
+
+def it_should_mark_rows_of_a_crashed_worker_as_outcome_unknown(app_config, make_payment_request):
+    config = app_config.model_copy(update={"shard_count": 2})
+    requests = [make_payment_request(f"user-{i}") for i in range(4)]
+
+    results = asyncio.run(
+        run_sharded(config, coalesce_payment_requests(requests), CrashingVenmoService),
+    )
+
+    assert sorted(r.request.venmo_id for r in results) == [f"user-{i}" for i in range(4)]
+    for result in results:
+        assert not result.success
+        assert result.outcome_unknown
+        assert "outcome unknown" in result.error_message
+
+
+def it_should_refuse_a_run_lock_that_is_already_held(tmp_path):
+    with run_lock(tmp_path) as acquired:
+        assert acquired
+        with run_lock(tmp_path) as acquired_again:
+            assert not acquired_again
+
+    with run_lock(tmp_path) as acquired:
+        assert acquired